@@ -6,7 +6,8 @@ __all__: tuple[str, ...] = ()
 
 from abc import ABCMeta
 from dataclasses import KW_ONLY, dataclass, fields
-from functools import reduce
+from functools import cache
+from math import inf
 from textwrap import indent
 from typing import TYPE_CHECKING, Any, Literal, TypeVar, overload
 
@@ -20,6 +21,7 @@ from stream_mapper.core.params import (
     freeze_params,
     set_param,
 )
+from stream_mapper.core.params.bounds import NoBounds
 from stream_mapper.core.setup_package import CompiledShim
 from stream_mapper.core.typing import (
     Array,
@@ -28,14 +30,16 @@ from stream_mapper.core.typing import (
     NNModel,
     NNNamespace,
 )
-from stream_mapper.core.utils import DataScaler, within_bounds
 from stream_mapper.core.utils.dataclasses import ArrayNamespaceReprMixin
 from stream_mapper.core.utils.frozen_dict import FrozenDict, FrozenDictField
 
 if TYPE_CHECKING:
     from stream_mapper.core import Data
+    from stream_mapper.core.params.bounds import ParameterBounds
+    from stream_mapper.core.params.scaler import ParamScaler
     from stream_mapper.core.prior import Prior
     from stream_mapper.core.typing import ParamNameAllOpts, ParamsLikeDict
+    from stream_mapper.core.utils import DataScaler
 
     Self = TypeVar("Self", bound="ModelBase[Array, NNModel]")  # type: ignore[valid-type]
 
@@ -43,7 +47,18 @@ if TYPE_CHECKING:
 #####################################################################
 
 
-@dataclass(unsafe_hash=True, repr=False)
+@cache
+def _field_names(cls: type, /) -> tuple[str, ...]:
+    """Names of the dataclass fields of a model class, for ``__str__``."""
+    return tuple(f.name for f in fields(cls))
+
+
+# NOTE: models are compared and hashed by identity. Hashing all the fields
+# (the parameters, priors, coordinate bounds, ...) is expensive and models are
+# mutable, so a field-based hash is not meaningful. Subclasses must also be
+# dataclasses with ``eq=False``, otherwise they get a field-based ``__eq__``
+# and are unhashable.
+@dataclass(eq=False, repr=False)
 class ModelBase(
     Model[Array, NNModel],
     ArrayNamespaceReprMixin[Array],
@@ -190,6 +205,47 @@ class ModelBase(
             )
             raise ValueError(msg)
 
+        # The lower and upper coordinate bounds, in the order of `coord_names`,
+        # for vectorized checks of the bounds. These are built once, here, so
+        # that no arrays are created (and cached) when tracing, e.g. by a JIT.
+        # Shape (K,), cast to match the data when used (see ``_asarray_like``).
+        self._coord_bnds_lo: tuple[float, ...] = tuple(
+            self.coord_bounds[n][0] for n in self.coord_names
+        )
+        self._coord_bnds_hi: tuple[float, ...] = tuple(
+            self.coord_bounds[n][1] for n in self.coord_names
+        )
+        self._coord_lo: Array = self.xp.asarray(self._coord_bnds_lo)
+        self._coord_hi: Array = self.xp.asarray(self._coord_bnds_hi)
+        # The coordinate names present in the data depend only on the names of
+        # the data, so they are cached. If only some of the coordinates are
+        # present, their bounds are also cached, as Python floats.
+        self._coord_bnds_plans: dict[
+            tuple[str, ...],
+            tuple[tuple[str, ...], tuple[float, ...] | None, tuple[float, ...] | None],
+        ] = {}
+
+        # How to unpack the parameter array: the column index, the (top-level
+        # name, sub-name or None), and the scaler of each parameter. The
+        # structure of the parameters is fixed, so this is computed once.
+        # See ``_unpack_params_from_arr``.
+        self._unpack_plan: tuple[
+            tuple[int, str, str | None, ParamScaler[Array]], ...
+        ] = tuple(
+            (i, top, sub[0] if sub else None, p.scaler)
+            for i, ((top, *sub), p) in enumerate(self.params.flatsitems())
+        )
+
+        # The parameter bounds, in the order of the parameters. These are used
+        # every time ``ln_prior`` and ``_forward_priors`` are called.
+        # `NoBounds` adds 0 to the log-prior and doesn't change the output of
+        # the network, so it is skipped rather than adding a term for it.
+        self._param_bounds: tuple[ParameterBounds[Array], ...] = tuple(
+            p.bounds
+            for p in self.params.flatvalues()
+            if not isinstance(p.bounds, NoBounds)
+        )
+
     # ========================================================================
 
     def _stack_param(self, p: Params[Array], k: str, cns: tuple[str, ...], /) -> Array:
@@ -257,16 +313,42 @@ class ModelBase(
         Params[Array]
         """
         pars: ParamsLikeDict[Array] = {}
-        k: ParamNameAllOpts
-        for i, (k, p) in enumerate(self.params.flatsitems()):
+        for i, top, sub, scaler in self._unpack_plan:
             # Unscale and set in the nested dict structure
-            set_param(pars, k, p.scaler.inverse_transform(arr[:, i]))
+            v = scaler.inverse_transform(arr[:, i])
+            if sub is None:
+                pars[top] = v
+            else:
+                pars.setdefault(top, {})[sub] = v  # type: ignore[index]
 
+        k: ParamNameAllOpts
         for k, v in (extras or {}).items():
             set_param(pars, k, v)
 
         return freeze_params(pars) if freeze else pars
 
+    # ========================================================================
+
+    def _asarray_like(self, values: Array | tuple[float, ...], x: Array, /) -> Array:
+        """Per-column constants as an array that broadcasts against ``x``.
+
+        The result has shape (1, K[, 1...]) for ``x`` of shape (N, K[, ...]),
+        and the floating point dtype and the device of ``x``, so that it
+        doesn't promote or move ``x``. This is a cast of ``values``, which is
+        done on every call: the result is not cached, as it may be traced.
+        """
+        xp = self.xp
+        try:  # only floating point dtypes can hold the (infinite) bounds
+            xp.finfo(x.dtype)
+        except (TypeError, ValueError):
+            dtype = None
+        else:
+            dtype = x.dtype
+        device = getattr(x, "device", None)  # not defined when traced
+        kw = {} if device is None or callable(device) else {"device": device}
+        sel = (None, slice(None)) + (None,) * (x.ndim - 2)
+        return xp.asarray(values, dtype=dtype, **kw)[sel]
+
     # ========================================================================
     # Statistics
 
@@ -276,23 +358,38 @@ class ModelBase(
         Zero everywhere except where the data are outside the
         coordinate bounds, where it is -inf.
         """
-        shape = data.array.shape[:1] + data.array.shape[2:]
-        where = reduce(
-            self.xp.logical_or,
-            (
-                ~within_bounds(data[k], *v)
-                for k, v in self.coord_bounds.items()
-                if k in data.names
-                # don't require all coordinates to be present in the data,
-                # e.g. "distmod" on an isochrone model.
-            ),
-            self.xp.zeros(shape, dtype=bool),
-        )
-        return self.xp.where(
-            where,
-            self.xp.full(shape, -self.xp.inf),
-            self.xp.zeros(shape),
-        )
+        # don't require all coordinates to be present in the data,
+        # e.g. "distmod" on an isochrone model.
+        plan = self._coord_bnds_plans.get(data.names)
+        if plan is None:
+            names = tuple(k for k in self.coord_names if k in data.names)
+            plan = (
+                (names, None, None)
+                if names == self.coord_names
+                else (
+                    names,
+                    tuple(self.coord_bounds[n][0] for n in names),
+                    tuple(self.coord_bounds[n][1] for n in names),
+                )
+            )
+            self._coord_bnds_plans[data.names] = plan
+        names, lo_, hi_ = plan
+
+        # Check all the coordinates at once: (N, K[, ...]) vs (1, K[, 1...])
+        xp = self.xp
+        x = data[names].array
+        lo = self._asarray_like(self._coord_lo if lo_ is None else lo_, x)
+        hi = self._asarray_like(self._coord_hi if hi_ is None else hi_, x)
+        # The comparisons, the reduction over coordinates and the selection
+        # are fused into one expression, without negating the mask.
+        # NOTE: the comparisons are not replaced by the sign bits of
+        # ``x - lo`` and ``hi - x``: with infinite bounds these can be NaN, the
+        # sign bit of NaN is arbitrary, and bit-casting isn't portable across
+        # the array namespaces.
+        inside = xp.all((x >= lo) & (x <= hi), 1)  # NaN is out of bounds
+        # The scalars are broadcast to the shape of the mask, so no filled
+        # arrays are allocated.
+        return xp.where(inside, 0.0, -inf)
 
     def ln_prior(self, mpars: Params[Array], data: Data[Array]) -> Array:
         """Log prior.
@@ -312,8 +409,8 @@ class ModelBase(
         # Coordinate Bounds
         lnp = self._ln_prior_coord_bnds(data)
         # Parameter Bounds
-        for p in self.params.flatvalues():
-            lnp = lnp + p.bounds.logpdf(mpars, data, self, lnp)
+        for bounds in self._param_bounds:
+            lnp = lnp + bounds.logpdf(mpars, data, self, lnp)
         # Priors
         for prior in self.priors:
             lnp = lnp + prior.logpdf(mpars, data, self, lnp)
@@ -353,8 +450,8 @@ class ModelBase(
             Same as input.
         """
         # Parameter bounds
-        for p in self.params.flatvalues():
-            out = p.bounds(out, scaled_data, self)
+        for bounds in self._param_bounds:
+            out = bounds(out, scaled_data, self)
 
         # Other priors  # TODO: a better way to do the order of the priors.
         for prior in self.priors:
@@ -367,7 +464,7 @@ class ModelBase(
     def __str__(self) -> str:
         """Return nicer string representation."""
         fs = (
-            indent(f"{f.name}: {getattr(self, f.name)!s}", prefix="\t")
-            for f in fields(self)
+            indent(f"{n}: {getattr(self, n)!s}", prefix="\t")
+            for n in _field_names(type(self))
         )
         return self.__class__.__name__ + "(\n" + "\n".join(fs) + "\n)"
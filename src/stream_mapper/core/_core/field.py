@@ -5,7 +5,7 @@ from __future__ import annotations
 __all__: tuple[str, ...] = ()
 
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Any, Generic, TypeVar, cast
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
 
 from stream_mapper.core.typing import Array, NNModel
 from stream_mapper.core.typing._nn import NNModelProtocol
@@ -43,7 +43,8 @@ class NNField(Generic[NNModel, OtherValue]):
         model_cls: Any,
     ) -> NNModel | OtherValue:
         if model is not None:
-            return cast("NNModel", getattr(model, self._name))
+            net: NNModel = getattr(model, self._name)
+            return net
         elif self.default is MISSING:
             msg = f"no default value for field {self._name!r}."
             raise AttributeError(msg)
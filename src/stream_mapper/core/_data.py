@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from copy import deepcopy
 from dataclasses import KW_ONLY, dataclass, field, fields, replace
+from operator import index, itemgetter
 from textwrap import indent
 from typing import (
     TYPE_CHECKING,
@@ -40,15 +41,24 @@ def _all_strs(seq: tuple[Any, ...]) -> TypeGuard[tuple[str, ...]]:
     return all(isinstance(x, str) for x in seq)
 
 
+_ARRAYLIKE_TYPES: set[type] = set()
+
+
 def _is_arraylike(obj: Any) -> TypeGuard[ArrayLike]:
     """Check if an object is array-like.
 
     This only exists b/c mypyc does not yet support runtime_checkable protocols,
     so `isinstance(obj, ArrayLike)` does not work.
 
-    Checks for the dtype and shape attributes.
+    Checks for the dtype and shape attributes. Types that pass are remembered,
+    so subsequent checks of the same type are a set lookup.
     """
-    return hasattr(obj, "dtype") and hasattr(obj, "shape")
+    if type(obj) in _ARRAYLIKE_TYPES:
+        return True
+    if hasattr(obj, "dtype") and hasattr(obj, "shape"):
+        _ARRAYLIKE_TYPES.add(type(obj))
+        return True
+    return False
 
 
 @dataclass(frozen=True, slots=True)
@@ -88,13 +98,81 @@ class Data(Generic[Array]):
             msg = "Data should not be a Data object."
             raise TypeError(msg)
 
-        # Map names to column indices.
-        object.__setattr__(self, "_n2k", {name: i for i, name in enumerate(self.names)})
+        # The names to column indices mapping, `_n2k`, is built lazily on first
+        # access (see `__getattr__`), since e.g. row selections never use it.
 
     # =========================================================================
 
+    # The most commonly accessed array attributes are defined explicitly, so
+    # they don't go through the (slower) attribute-miss path of `__getattr__`.
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        """Shape of the underlying array."""
+        return self.array.shape
+
+    @property
+    def dtype(self) -> Any:
+        """Data type of the underlying array."""
+        return self.array.dtype
+
+    @property
+    def ndim(self) -> int:
+        """Number of dimensions of the underlying array."""
+        return self.array.ndim
+
+    @property
+    def size(self) -> int:
+        """Number of elements in the underlying array."""
+        return self.array.size  # type: ignore[attr-defined,no-any-return]
+
+    def __array__(self, *args: Any, **kwargs: Any) -> Any:
+        """Convert to a NumPy array."""
+        return self.array.__array__(*args, **kwargs)  # type: ignore[attr-defined]
+
+    # The other array protocols are dunders, which `__getattr__` doesn't
+    # forward, so they are forwarded here. As properties, they are only
+    # present if the underlying array has them.
+
+    @property
+    def __array_namespace__(self) -> Any:
+        """The Array API namespace method of the underlying array."""
+        return self.array.__array_namespace__  # type: ignore[attr-defined]
+
+    @property
+    def __dlpack__(self) -> Any:
+        """The DLPack export method of the underlying array."""
+        return self.array.__dlpack__  # type: ignore[attr-defined]
+
+    @property
+    def __dlpack_device__(self) -> Any:
+        """The DLPack device method of the underlying array."""
+        return self.array.__dlpack_device__  # type: ignore[attr-defined]
+
+    @property
+    def __array_interface__(self) -> Any:
+        """The NumPy array interface of the underlying array."""
+        return self.array.__array_interface__  # type: ignore[attr-defined]
+
+    @property
+    def __array_priority__(self) -> Any:
+        """The NumPy array priority of the underlying array."""
+        return self.array.__array_priority__  # type: ignore[attr-defined]
+
     def __getattr__(self, key: str) -> Any:
         """Get an attribute of the underlying array."""
+        # Map names to column indices. The slot is only unset until the
+        # first access, after which this is not called.
+        if key == "_n2k":
+            n2k = {name: i for i, name in enumerate(self.names)}
+            object.__setattr__(self, "_n2k", n2k)
+            return n2k
+
+        # Private and dunder attributes are not forwarded. This short-circuits
+        # probing by e.g. `pickle` and `copy`, and avoids infinite recursion
+        # when the `array` slot is not yet set.
+        if key.startswith("_") or key == "array":
+            raise AttributeError(key)
         return getattr(self.array, key)
 
     # =========================================================================
@@ -283,43 +361,8 @@ class Data(Generic[Array]):
                 [[8],
                 [9]]]), names=('a', 'b'))
         """
-        if isinstance(key, int):  # get a row
-            return type(self)(self.array[None, key, :], names=self.names)  # type: ignore[index]
-        elif isinstance(key, str):  # get a column
-            return cast("Array", self.array[:, self._n2k[key]])  # type: ignore[index]
-        elif isinstance(key, tuple):
-            if _all_strs(key):  # multiple columns
-                return type(self)(
-                    self.array[:, [self._n2k[k] for k in key]],  # type: ignore[index]
-                    names=key,
-                )
-            elif len(key) > 1 and isinstance(key[1], int):  # get column
-                return cast("Array", self.array[key])  # type: ignore[index]
-
-            array: Array = self.array[
-                (
-                    key[0],  # row key
-                    _parse_key_elt(key[1], self._n2k),  # column key(s)
-                    *key[2:],  # additional key(s)
-                )
-            ]  # type: ignore[index]
-            if array.ndim == 1:
-                array = array[None, :]  # always return a 2D array
-
-            if isinstance(key[1], slice):
-                names = self.names[key[1]]
-            elif isinstance(key[1], int):
-                names = (self.names[key[1]],)
-            elif isinstance(key[1], str):
-                names = (key[1],)
-            else:
-                names = tuple(
-                    (i if isinstance(i, str) else str(self.names[i])) for i in key[1]
-                )
-
-            return type(self)(array, names=names)
-
-        return type(self)(self.array[key], names=self.names)  # type: ignore[index]
+        getitem = _GETITEM_DISPATCH.get(type(key), _getitem_any)
+        return cast("Array | Self", getitem(self, key))
 
     # =========================================================================
     # Mapping methods
@@ -413,6 +456,118 @@ class Data(Generic[Array]):
         )
 
 
+def _new_unchecked(cls: type[Self], array: Any, names: tuple[str, ...], /) -> Self:
+    """Construct `Data` without the ``__post_init__`` checks.
+
+    For internal use only, when ``array`` is known to be a valid array whose
+    columns match ``names``.
+    """
+    data = object.__new__(cls)
+    object.__setattr__(data, "array", array)
+    object.__setattr__(data, "names", names)
+    return data
+
+
+def _clone_with_array(data: Self, array: Any, /) -> Self:
+    """Construct `Data` like ``data``, but with a different ``array``.
+
+    For internal use only, when ``array`` is a selection of rows of
+    ``data.array``, so the columns are unchanged. The (immutable) name-to-index
+    mapping is shared with ``data``, if it has already been built.
+    """
+    new = _new_unchecked(type(data), array, data.names)
+    # `object.__getattribute__` doesn't fall back to `__getattr__`, so this
+    # doesn't build the mapping if it is not yet set.
+    try:
+        n2k = object.__getattribute__(data, "_n2k")
+    except AttributeError:
+        pass
+    else:
+        object.__setattr__(new, "_n2k", n2k)
+    return new
+
+
+# -----------------------------------------------------------------------------
+# `Data.__getitem__` implementations, dispatched on the exact type of the key.
+
+
+def _getitem_str(data: Data[Array], key: str, /) -> Array:
+    """Get a column."""
+    return data.array[:, data._n2k[key]]
+
+
+def _getitem_int(data: Self, key: int, /) -> Self:
+    """Get a row. ``key`` must be exactly an `int` (not e.g. a `bool`)."""
+    return _clone_with_array(data, data.array[None, key, :])  # type: ignore[index]
+
+
+def _getitem_slice(data: Self, key: slice, /) -> Self:
+    """Get a slice of rows."""
+    return _clone_with_array(data, data.array[key])  # type: ignore[index]
+
+
+def _getitem_tuple(data: Self, key: tuple[Any, ...], /) -> Array | Self:
+    """Get columns, or elements by row and column key(s)."""
+    n2k = data._n2k
+    if _all_strs(key):  # multiple columns
+        # The columns match the names by construction, so skip the checks.
+        return _new_unchecked(
+            type(data),
+            data.array[:, [n2k[k] for k in key]],  # type: ignore[index]
+            key,
+        )
+    elif len(key) > 1 and isinstance(key[1], int):  # get column
+        column: Array = data.array[key]  # type: ignore[index]
+        return column
+
+    array: Array = data.array[
+        (
+            key[0],  # row key
+            _parse_key_elt(key[1], n2k),  # column key(s)
+            *key[2:],  # additional key(s)
+        )
+    ]  # type: ignore[index]
+    if array.ndim == 1:
+        array = array[None, :]  # always return a 2D array
+
+    if isinstance(key[1], slice):
+        names = data.names[key[1]]
+    elif isinstance(key[1], int):
+        names = (data.names[key[1]],)
+    elif isinstance(key[1], str):
+        names = (key[1],)
+    else:
+        names = tuple((i if isinstance(i, str) else str(data.names[i])) for i in key[1])
+
+    return type(data)(array, names=names)
+
+
+def _getitem_any(data: Self, key: Any, /) -> Array | Self:
+    """Get rows, falling back to ``isinstance`` checks for key subclasses."""
+    if isinstance(key, int):  # get a row, validating the result (e.g. bool)
+        return type(data)(data.array[None, key, :], names=data.names)  # type: ignore[index]
+    elif isinstance(key, str):  # get a column
+        return _getitem_str(data, key)
+    elif isinstance(key, tuple):
+        return _getitem_tuple(data, key)
+    elif getattr(key, "ndim", None) == 0:  # e.g. a NumPy integer scalar
+        try:
+            row = index(key)
+        except TypeError:  # not an integer, e.g. a boolean scalar
+            pass
+        else:
+            return _getitem_int(data, row)
+    return type(data)(data.array[key], names=data.names)  # type: ignore[index]
+
+
+_GETITEM_DISPATCH: Final[dict[type, Callable[[Any, Any], Any]]] = {
+    str: _getitem_str,
+    int: _getitem_int,
+    slice: _getitem_slice,
+    tuple: _getitem_tuple,
+}
+
+
 def _parse_key_elt(key: Any, n2k: dict[str, int]) -> KeyT:
     """Parse a key.
 
@@ -432,6 +587,12 @@ def _parse_key_elt(key: Any, n2k: dict[str, int]) -> KeyT:
     elif isinstance(key, str):
         return (n2k[key],)
     elif isinstance(key, list) or _is_arraylike(key):
+        if (
+            isinstance(key, list)
+            and len(key) > 1
+            and all(isinstance(k, str) for k in key)
+        ):  # all names: look them up in one C-level call
+            return list(itemgetter(*key)(n2k))
         return [n2k[k] if isinstance(k, str) else k for k in key]
     elif isinstance(key, slice):
         return slice(
@@ -125,6 +125,12 @@ class ModelsBase(
             msg = "must have at least one component."
             raise ValueError(msg)
 
+        # The components are fixed, so their items are stored as a tuple for
+        # faster iteration in the statistics methods.
+        self._components_items: tuple[tuple[str, Model[Array, NNModel]], ...] = tuple(
+            self.components.items()
+        )
+
         super().__post_init__()
 
     @cached_property
@@ -147,7 +153,7 @@ class ModelsBase(
         cbs: dict[str, BoundsT] = {
             k: v for m in self.components.values() for k, v in m.coord_bounds.items()
         }
-        return FrozenDict(cbs)
+        return FrozenDict(cbs, __unsafe_skip_copy__=True)
 
     @property
     @abstractmethod
@@ -211,9 +217,12 @@ class ModelsBase(
         -------
         Array
         """
-        # Loop over the components
-        lnp: Array = self.xp.zeros(())
-        for name, m in self.components.items():
+        # Loop over the components, seeding the sum with the first one.
+        # (There is always at least one component.)
+        components = iter(self._components_items)
+        name, m = next(components)
+        lnp: Array = m.ln_prior(mpars.get_prefixed(name), data)
+        for name, m in components:
             lnp = lnp + m.ln_prior(mpars.get_prefixed(name), data)
         # Parameter Bounds
         for param in self.params.flatvalues():
@@ -235,8 +244,9 @@ class ModelsBase(
         -------
         Array
         """
-        # Loop over the components
-        lne: Array = self.xp.zeros(())
-        for m in self.components.values():
+        # Loop over the components, seeding the sum with the first one.
+        components = iter(self._components_items)
+        lne: Array = next(components)[1].ln_evidence(data)
+        for _, m in components:
             lne = lne + m.ln_evidence(data)
         return lne
@@ -27,7 +27,7 @@ if TYPE_CHECKING:
     from stream_mapper.core.utils.frozen_dict import FrozenDict
 
 
-@dataclass(unsafe_hash=True, repr=False)
+@dataclass(eq=False, repr=False)
 class IndependentModels(ModelsBase[Array, NNModel]):
     """Composite of a few models that acts like one model.
 
@@ -158,7 +158,7 @@ class IndependentModels(ModelsBase[Array, NNModel]):
 
         # Iterate through the components
         j: int = 0
-        for n, m in self.components.items():  # iter thru models
+        for n, m in self._components_items:  # iter thru models
             # number of parameters
             delta = len(m.params.flatkeys())
 
@@ -167,7 +167,7 @@ class IndependentModels(ModelsBase[Array, NNModel]):
                 continue
 
             # Get weight and relevant parameters by index
-            marr = arr[:, list(range(j, j + delta))]
+            marr = arr[:, slice(j, j + delta)]
 
             # Skip empty (and incrementing the index)
             if marr.shape[1] == 0:
@@ -228,12 +228,17 @@ class IndependentModels(ModelsBase[Array, NNModel]):
         -------
         Array
         """
-        lnlik: Array = self.xp.zeros(())
-        for name, m in self.components.items():
-            lnlik = lnlik + m.ln_likelihood(
+        lnliks = (
+            m.ln_likelihood(
                 mpars.get_prefixed(name),
                 data,
                 where=where,
                 **get_prefixed_kwargs(name, kwargs),
             )
+            for name, m in self._components_items
+        )
+        # Sum over the components, seeding with the first one.
+        lnlik: Array = next(lnliks)
+        for v in lnliks:
+            lnlik = lnlik + v
         return lnlik
@@ -499,7 +499,7 @@ class ComponentAllProbabilities(
 # ============================================================================
 
 
-@dataclass(repr=False)
+@dataclass(eq=False, repr=False)
 class MixtureModel(
     ModelsBase[Array, NNModel], ComponentAllProbabilities[Array, NNModel]
 ):
@@ -547,6 +547,12 @@ class MixtureModel(
         self._includes_bkg: bool = includes_bkg
         self._bkg_slc = slice(-1) if includes_bkg else slice(None)
 
+        # The weight parameter names of the non-background components, used to
+        # compute the background weight when unpacking parameters.
+        self._fg_weight_names: tuple[str, ...] = tuple(
+            f"{k}.{WEIGHT_NAME}" for k in tuple(self.components.keys())[self._bkg_slc]
+        )
+
     @cached_property
     def composite_params(self) -> ModelParameters[Array]:  # type: ignore[override]
         cps: dict[
@@ -623,7 +629,7 @@ class MixtureModel(
         # Unpack the parameters
         pars: ParamsLikeDict[Array] = {}
         j: int = 0
-        for n, m in self.components.items():  # iter thru models
+        for n, m in self._components_items:  # iter thru models
             # Weight
             if n != BACKGROUND_KEY:
                 ln_weight = arr[:, j]
@@ -636,17 +642,16 @@ class MixtureModel(
                 # any network output, rather just a placeholder.
 
                 # The background weight is 1 - the other weights
-                other_weights = self.xp.stack(
-                    tuple(
-                        cast("Array", pars[f"{k}.{WEIGHT_NAME}"])
-                        for k in tuple(self.components.keys())[:-1]
-                        # bkg is the last component
-                    ),
-                    1,
-                )
-                ln_weight = self.xp.log(
-                    -self.xp.expm1(self.xp.special.logsumexp(other_weights, 1))
-                )
+                if len(self._fg_weight_names) == 1:
+                    # The log-sum-exp of a single weight is just that weight.
+                    ln_other_weights = cast("Array", pars[self._fg_weight_names[0]])
+                else:
+                    other_weights = self.xp.stack(
+                        tuple(cast("Array", pars[k]) for k in self._fg_weight_names),
+                        1,
+                    )
+                    ln_other_weights = self.xp.special.logsumexp(other_weights, 1)
+                ln_weight = self.xp.log(-self.xp.expm1(ln_other_weights))
 
             j += 1  # Increment the index (weight)
 
@@ -718,9 +723,11 @@ class MixtureModel(
         """
         # Get the parameters for each model, stripping the model name,
         # and use that to evaluate the log likelihood for the model.
-        lnliks = (  # (N,)
+        lnliks = tuple(  # (N,)
             self.component_ln_likelihood(name, mpars, data, where=where, **kwargs)
-            for name in self.components
+            for name, _ in self._components_items
         )
-        # Sum over the models, keeping the data dimension
-        return self.xp.special.logsumexp(self.xp.vstack(tuple(lnliks)), 0)
+        # Sum over the models, keeping the data dimension. The components are
+        # stacked along a new leading axis (K, N) so the log-sum-exp is a
+        # single, numerically-stable reduction.
+        return self.xp.special.logsumexp(self.xp.stack(lnliks, 0), 0)
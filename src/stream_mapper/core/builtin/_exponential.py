@@ -7,6 +7,7 @@ from stream_mapper.core.utils.compat import array_at
 __all__: tuple[str, ...] = ()
 
 from dataclasses import KW_ONLY, dataclass
+from math import inf
 from typing import TYPE_CHECKING
 
 from stream_mapper.core._core.base import ModelBase
@@ -18,7 +19,7 @@ if TYPE_CHECKING:
     from stream_mapper.core import Data, Params
 
 
-@dataclass(repr=False)
+@dataclass(eq=False, repr=False)
 class Exponential(ModelBase[Array, NNModel]):
     r"""(Truncated) Univariate Exponential model.
 
@@ -138,7 +139,7 @@ class Exponential(ModelBase[Array, NNModel]):
             a=(_0 + self._a)[idx],
             b=(_0 + self._b)[idx],
             xp=self.xp,
-            nil=-self.xp.inf,
+            nil=-inf,
             m_eps=self.m_eps,
         )
         # missing data has a log-likelihood of 0
@@ -9,6 +9,7 @@ from math import log
 from typing import TYPE_CHECKING, Final
 
 from stream_mapper.core._api import SupportsXP
+from stream_mapper.core._connect.xp_namespace import XP_NAMESPACE
 from stream_mapper.core.params import set_param
 from stream_mapper.core.typing import Array
 
@@ -30,6 +31,12 @@ class Parallax2DistMod(SupportsXP[Array]):
     neg_clip_mu: float = 1e-30
     array_namespace: ArrayNamespace[Array]
 
+    def __post_init__(self) -> None:
+        if isinstance(self.array_namespace, str):
+            object.__setattr__(
+                self, "array_namespace", XP_NAMESPACE[self.array_namespace]
+            )
+
     def __call__(
         self, pars: dict[str, Array | dict[str, Array]], /
     ) -> dict[str, Array | dict[str, Array]]:
@@ -39,7 +46,10 @@ class Parallax2DistMod(SupportsXP[Array]):
         #               = -5 log10(plx [mas] / 1e3) - 5
         #               = 10 - 5 log10(plx [mas])
         # dm = 10 - 5 * xp.log10(pars["photometric.parallax"]["mu"].reshape((-1, 1)))
-        mu = self.xp.clip(pars[self.astrometric_coord]["mu"], self.neg_clip_mu)  # type: ignore[arg-type]
+        # Only a lower bound, so `maximum` (one op) rather than `clip`. The floor
+        # takes the dtype of `mu` so it doesn't promote it.
+        mu: Array = pars[self.astrometric_coord]["mu"]  # type: ignore[assignment]
+        mu = self.xp.maximum(mu, self.xp.asarray(self.neg_clip_mu, dtype=mu.dtype))
         dm = 10 - 5 * self.xp.log10(mu)
         ln_dm_sigma = self.xp.log(
             _five_over_log10
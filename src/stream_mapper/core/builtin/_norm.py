@@ -18,7 +18,7 @@ if TYPE_CHECKING:
     from stream_mapper.core import Data, Params
 
 
-@dataclass(repr=False)
+@dataclass(eq=False, repr=False)
 class Normal(ModelBase[Array, NNModel]):
     r"""Univariate Gaussian.
 
@@ -17,7 +17,7 @@ if TYPE_CHECKING:
     from stream_mapper.core import Data, Params
 
 
-@dataclass(repr=False)
+@dataclass(eq=False, repr=False)
 class SkewNormal(Normal[Array, NNModel]):
     r"""1D Gaussian with mixture weight.
 
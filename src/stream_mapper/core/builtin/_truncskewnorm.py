@@ -17,7 +17,7 @@ if TYPE_CHECKING:
     from stream_mapper.core import Data, Params
 
 
-@dataclass
+@dataclass(eq=False)
 class TruncatedSkewNormal(SkewNormal[Array, NNModel]):
     """Truncated Skew-Normal."""
 
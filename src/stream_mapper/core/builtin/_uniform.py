@@ -2,24 +2,33 @@
 
 from __future__ import annotations
 
-from stream_mapper.core.utils.compat import array_at
-
 __all__: tuple[str, ...] = ()
 
 from dataclasses import dataclass
+from functools import cache
+from math import inf, isfinite, log
 from typing import TYPE_CHECKING, Any
 
 from stream_mapper.core._core.base import ModelBase
 from stream_mapper.core._core.field import NNField
-from stream_mapper.core.builtin._stats.uniform import logpdf as uniform_logpdf
 from stream_mapper.core.builtin._utils import WhereRequiredError
 from stream_mapper.core.typing import Array, NNModel
 
 if TYPE_CHECKING:
     from stream_mapper.core import Data, Params
+    from stream_mapper.core.typing import BoundsT
+
+
+@cache
+def _ln_pdfs(bounds: tuple[BoundsT, ...], /) -> tuple[float, ...]:
+    """Log-pdf, -log(b - a), of a uniform distribution for each bound.
+
+    Models often share the same coordinate bounds, so this is memoized.
+    """
+    return tuple(-log(b - a) for a, b in bounds)
 
 
-@dataclass(repr=False)
+@dataclass(eq=False, repr=False)
 class Uniform(ModelBase[Array, NNModel]):
     """Uniform background model."""
 
@@ -33,16 +42,20 @@ class Uniform(ModelBase[Array, NNModel]):
             msg = "net must be None"
             raise ValueError(msg)
 
-        # Pre-compute the log-difference, shape (1, F)
-        # First need to check that the bound are finite.
-        ab_ = self.xp.asarray(tuple(self.coord_bounds.values()))
-        if not self.xp.isfinite(ab_).all():
+        # The bounds are the coordinate bounds of the model, in the order of
+        # `coord_names`. First need to check that the bound are finite.
+        if not all(map(isfinite, self._coord_bnds_lo + self._coord_bnds_hi)):
             msg = "a bound of a coordinate is not finite"
             raise ValueError(msg)
-        self._a: Array
-        self._b: Array
-        object.__setattr__(self, "_a", ab_[None, :, 0])  # ([N], F)
-        object.__setattr__(self, "_b", ab_[None, :, 1])  # ([N], F)
+
+        # The log-pdf within the bounds is constant, -log(b - a), so it is
+        # computed once here rather than on every likelihood evaluation. The
+        # bounds are Python floats, so this is done in Python, and the result
+        # is a constant (not a traced op) for JIT-compiling backends. Shape
+        # (F,), cast to match the data when used.
+        self._ln_pdf: Array
+        ln_pdf = _ln_pdfs(tuple(self.coord_bounds[n] for n in self.coord_names))
+        object.__setattr__(self, "_ln_pdf", self.xp.asarray(ln_pdf))
 
     # ========================================================================
     # Statistics
@@ -79,28 +92,25 @@ class Uniform(ModelBase[Array, NNModel]):
         # 'where' is used to indicate which data points are available. If
         # 'where' is not provided, then all data points are assumed to be
         # available.
+        # If all data points are available there is no mask to apply.
+        idx: Array | None = None
         if where is not None:
             idx = where[self.coord_names].array
         elif self.require_where:
             raise WhereRequiredError
-        else:
-            idx = self.xp.ones((len(data), self.ndim), dtype=bool)
-            # This has shape (N,F) so will broadcast correctly.
 
         x = data[self.coord_names].array  # (N, F)
         # Get the slope from `mpars` we check param names to see if the
         # slope is a parameter. If it is not, then we assume it is 0.
         # When the slope is 0, the log-likelihood reduces to a Uniform.
 
-        _0 = self.xp.zeros_like(x)
         # the distribution is not affected by the errors!
         # if self.coord_err_names is not None: pass
 
-        value = uniform_logpdf(
-            x[idx], a=(_0 + self._a)[idx], b=(_0 + self._b)[idx], xp=self.xp
-        )
-
-        lnliks = self.xp.full_like(x, 0)  # missing data will be ignored
-        lnliks = array_at(lnliks, idx).set(value)
-
-        return lnliks.sum(1)
+        # -log(b - a) within the bounds, -inf outside (and for NaN).
+        a = self._asarray_like(self._coord_lo, x)  # (1, F)
+        b = self._asarray_like(self._coord_hi, x)  # (1, F)
+        ln_pdf = self._asarray_like(self._ln_pdf, x)  # (1, F)
+        value = self.xp.where((a <= x) & (x <= b), ln_pdf, -inf)
+        # missing data will be ignored
+        return (value if idx is None else self.xp.where(idx, value, 0)).sum(1)
@@ -5,7 +5,7 @@ from __future__ import annotations
 __all__: tuple[str, ...] = ()
 
 from dataclasses import KW_ONLY, dataclass, field, replace
-from typing import TYPE_CHECKING, Any, Generic, cast
+from typing import TYPE_CHECKING, Any, Generic
 
 from stream_mapper.core.params.bounds._base import ParameterBounds  # noqa: TCH001
 from stream_mapper.core.params.scaler._builtin import Identity
@@ -31,7 +31,8 @@ class ModelScalerField:
             msg = f"no default value for {self._name!r}."
             raise AttributeError(msg)
 
-        return cast("ParamScaler[Array]", getattr(model, self._name))
+        scaler: ParamScaler[Array] = getattr(model, self._name)
+        return scaler
 
     def __set__(
         self, model: ModelParameter[Array], value: ParamScaler[Array] | None
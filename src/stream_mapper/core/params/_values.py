@@ -9,6 +9,7 @@ import itertools
 from typing import TYPE_CHECKING, TypeVar, overload
 
 from stream_mapper.core.setup_package import PACK_PARAM_JOIN
+from stream_mapper.core.utils.cached_property import cached_noargmethod
 from stream_mapper.core.utils.frozen_dict import FrozenDict
 
 if TYPE_CHECKING:
@@ -33,13 +34,30 @@ class Params(FrozenDict[str, V | FrozenDict[str, V]]):
             super().__init__(m._dict, __unsafe_skip_copy__=True)
             return
 
-        # Freeze sub-dicts
+        # Freeze sub-dicts. Already frozen sub-dicts are immutable, so they
+        # are shared rather than copied.
         d: dict[str, V | FrozenDict[str, V]] = {
-            k: (v if not isinstance(v, Mapping) else FrozenDict[str, V](v))
+            k: (
+                v
+                if not isinstance(v, Mapping) or isinstance(v, FrozenDict)
+                else FrozenDict[str, V](v)
+            )
             for k, v in itertools.chain(m.items(), kwargs.items())
         }
         super().__init__(d, __unsafe_skip_copy__=True)
 
+    @classmethod
+    def _from_frozen(cls, d: dict[str, V | FrozenDict[str, V]], /) -> Params[V]:
+        """Construct from a dict whose sub-dicts are already frozen.
+
+        This skips ``__init__``, which would check and copy the values. The
+        dict is used directly, so it must not be mutated afterwards.
+        """
+        self = object.__new__(cls)
+        self._dict = d
+        self._hash = None
+        return self
+
     # -----------------------------------------------------
 
     @overload
@@ -56,8 +74,16 @@ class Params(FrozenDict[str, V | FrozenDict[str, V]]):
 
     def __getitem__(self, key: ParamNameAllOpts) -> V | FrozenDict[str, V]:
         if isinstance(key, str):
-            value = self._dict[key]
-        elif len(key) == 1:
+            return self._dict[key]
+
+        # Tuple keys are looked up in a flat mapping, built on first use.
+        try:
+            return self._tuplekeyed()[key]
+        except (KeyError, TypeError):
+            pass
+
+        # Fall back to the structured lookup to raise the appropriate error.
+        if len(key) == 1:
             value = self._dict[key[0]]
         elif len(key) == LEN_NAME_TUPLE:
             cm = self._dict[key[0]]
@@ -68,6 +94,14 @@ class Params(FrozenDict[str, V | FrozenDict[str, V]]):
             raise KeyError(str(key))
         return value
 
+    @cached_noargmethod
+    def _tuplekeyed(self) -> dict[ParamNameTupleOpts, V | FrozenDict[str, V]]:
+        """All the parameters and sub-parameters, keyed by tuple."""
+        flat: dict[ParamNameTupleOpts, V | FrozenDict[str, V]]
+        flat = {(k,): v for k, v in self._dict.items()}
+        flat.update(self.flatsitems())
+        return flat
+
     def unfreeze(self) -> dict[str, V | dict[str, V]]:  # type: ignore[override]
         """Unfreeze the parameters."""
         return unfreeze_params(self)
@@ -76,17 +110,19 @@ class Params(FrozenDict[str, V | FrozenDict[str, V]]):
     # Flats
     # Tuple keys are used to access the parameters.
 
-    # TODO: cache, speed up, and ItemsView
+    # Params are immutable, so the flattened views are computed once.
+
+    @cached_noargmethod
     def flatsitems(self) -> tuple[tuple[ParamNameTupleOpts, V], ...]:
         """Flattened items."""
         return tuple(_flats_iter(self))
 
-    # TODO: cache
+    @cached_noargmethod
     def flatskeys(self) -> tuple[ParamNameTupleOpts, ...]:
         """Flattened keys."""
         return tuple(k for k, _ in self.flatsitems())
 
-    # TODO: cache
+    @cached_noargmethod
     def flatsvalues(self) -> tuple[V, ...]:
         """Flattened values."""
         return tuple(v for _, v in self.flatsitems())
@@ -94,19 +130,19 @@ class Params(FrozenDict[str, V | FrozenDict[str, V]]):
     # =========================================================================
     # Flat
 
+    @cached_noargmethod
     def flatitems(self) -> tuple[tuple[str, V], ...]:
         """Flat items."""
-        return tuple((PACK_PARAM_JOIN.join(k), v) for k, v in _flats_iter(self))
+        return tuple((PACK_PARAM_JOIN.join(k), v) for k, v in self.flatsitems())
 
-    # TODO: cache
+    @cached_noargmethod
     def flatkeys(self) -> tuple[str, ...]:
         """Flat keys."""
         return tuple(k for k, _ in self.flatitems())
 
-    # TODO: cache
     def flatvalues(self) -> tuple[V, ...]:
         """Flat values."""
-        return tuple(v for _, v in self.flatitems())
+        return self.flatsvalues()
 
     # =========================================================================
 
@@ -114,11 +150,13 @@ class Params(FrozenDict[str, V | FrozenDict[str, V]]):
         """Get the keys starting with the prefix, stripped of that prefix."""
         prefix = prefix + "." if not prefix.endswith(".") else prefix
         lp = len(prefix)
-        return type(self)({k[lp:]: v for k, v in self.items() if k.startswith(prefix)})
+        return self._from_frozen(
+            {k[lp:]: v for k, v in self._dict.items() if k.startswith(prefix)}
+        )
 
     def add_prefix(self, prefix: str, /) -> Params[V]:
         """Add the prefix to the keys."""
-        return add_prefix(self, prefix)
+        return self._from_frozen({f"{prefix}{k}": v for k, v in self._dict.items()})
 
 
 def _flats_iter(
@@ -259,4 +297,6 @@ def add_prefix(m: M, /, prefix: str) -> M:
         The mapping with the prefix added to the keys.
         Same type as the input mapping.
     """
+    if isinstance(m, Params):
+        return m.add_prefix(prefix)
     return m.__class__({f"{prefix}{k}": v for k, v in m.items()})
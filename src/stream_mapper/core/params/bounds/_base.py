@@ -12,7 +12,7 @@ from stream_mapper.core._api import SupportsXP
 from stream_mapper.core._connect.xp_namespace import XP_NAMESPACE
 from stream_mapper.core.params.scaler import ParamScaler  # noqa: TCH001
 from stream_mapper.core.typing import Array, ArrayNamespace, ParamNameTupleOpts
-from stream_mapper.core.utils import array_at, within_bounds
+from stream_mapper.core.utils import within_bounds
 from stream_mapper.core.utils.dataclasses import ArrayNamespaceReprMixin
 
 if TYPE_CHECKING:
@@ -127,10 +127,16 @@ class ParameterBounds(
             msg = "need to set param_name"
             raise ValueError(msg)
 
-        bp = self.xp.zeros_like(mpars[self.param_name])
-        return array_at(
-            bp, ~within_bounds(mpars[self.param_name], self.lower, self.upper)
-        ).set(self.neg_inf)
+        # Zero within the bounds, `neg_inf` outside, in one pass. The zero has
+        # the dtype and device of the parameter, so the result does too.
+        value = mpars[self.param_name]
+        device = getattr(value, "device", None)  # not defined when traced
+        kw = {} if device is None or callable(device) else {"device": device}
+        return self.xp.where(
+            within_bounds(value, self.lower, self.upper),
+            self.xp.asarray(0.0, dtype=value.dtype, **kw),
+            self.neg_inf,
+        )
 
     @abstractmethod
     def __call__(
@@ -21,6 +21,12 @@ if TYPE_CHECKING:
 Self = TypeVar("Self", bound="Prior[Array]")  # type: ignore[valid-type]
 
 
+# NOTE: `slots=True` is deliberately not used. The zero-argument `super()` in
+# `__new__` and the subclasses' `__post_init__` does not work on the new class
+# that `dataclass` creates for slots, the non-dataclass bases (e.g. `SupportsXP`)
+# have no `__slots__` so instances would keep a `__dict__` regardless, and
+# subclasses cache derived attributes (e.g. `ControlRegions._x`) on the
+# instance.
 @dataclass(frozen=True, repr=False)
 class Prior(ArrayNamespaceReprMixin[Array], SupportsXP[Array], metaclass=ABCMeta):
     """Prior."""
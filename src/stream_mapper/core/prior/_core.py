@@ -4,13 +4,15 @@ from __future__ import annotations
 
 __all__: tuple[str, ...] = ()
 
-from dataclasses import dataclass
-from typing import TYPE_CHECKING, Protocol
+from dataclasses import KW_ONLY, InitVar, dataclass
+from typing import TYPE_CHECKING, Any, Protocol
 
 from stream_mapper.core.prior._base import Prior
 from stream_mapper.core.typing import Array
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from stream_mapper.core import Data, ModelAPI as Model, Params
     from stream_mapper.core.typing import NNModel
 
@@ -42,11 +44,40 @@ class ForwardHook(Protocol[Array]):
 
 @dataclass(frozen=True, repr=False)
 class FunctionPrior(Prior[Array]):
-    """Prior with custom function hooks."""
+    """Prior with custom function hooks.
+
+    Parameters
+    ----------
+    logpdf_hook : LogPDFHook[Array]
+        The log-pdf function, see :meth:`logpdf`.
+    forward_hook : ForwardHook[Array]
+        The forward function, see :meth:`__call__`.
+
+    hook_compiler : Callable[[Callable], Callable] | None, optional keyword-only
+        A function that compiles the hooks, e.g. ``jax.jit`` or
+        ``torch.compile``. It is applied once, at construction, to both hooks.
+        Default is `None`, which uses the hooks as given.
+    """
 
     logpdf_hook: LogPDFHook[Array]
     forward_hook: ForwardHook[Array]
 
+    _: KW_ONLY
+    hook_compiler: InitVar[
+        Callable[[Callable[..., Any]], Callable[..., Any]] | None
+    ] = None
+
+    def __post_init__(
+        self,
+        hook_compiler: Callable[[Callable[..., Any]], Callable[..., Any]] | None,
+    ) -> None:
+        super().__post_init__()
+
+        # Compile the hooks once, so each evaluation is a single compiled call.
+        if hook_compiler is not None:
+            object.__setattr__(self, "logpdf_hook", hook_compiler(self.logpdf_hook))
+            object.__setattr__(self, "forward_hook", hook_compiler(self.forward_hook))
+
     def logpdf(
         self,
         mpars: Params[Array],
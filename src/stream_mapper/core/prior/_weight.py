@@ -104,11 +104,15 @@ class HardThreshold(Prior[Array]):
         Array
             The logpdf.
         """
-        lnp = self.xp.zeros_like(mpars[(self.param_name,)])
+        value = mpars[(self.param_name,)]
         where = within_bounds(data[self.coord_name], self.lower, self.upper) & (
-            mpars[(self.param_name,)] > self.threshold
+            value > self.threshold
         )
-        return array_at(lnp, where).set(-self.xp.inf)
+        # -inf where the threshold is exceeded, a (broadcast) scalar 0 elsewhere,
+        # with the dtype and device of the weight.
+        device = getattr(value, "device", None)  # not defined when traced
+        kw = {} if device is None or callable(device) else {"device": device}
+        return self.xp.where(where, -inf, self.xp.asarray(0.0, dtype=value.dtype, **kw))
 
     def __call__(
         self, pred: Array, data: Data[Array], model: ModelsBase[Array, NNModel]  # type: ignore[override]
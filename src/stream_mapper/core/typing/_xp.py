@@ -42,13 +42,18 @@ class ArrayNamespace(Protocol[Array]):
         """Absolute value."""
         ...
 
+    @staticmethod
+    def all(array: Array, /, axis: int | None = None) -> Array:  # noqa: A003
+        """All."""
+        ...
+
     @staticmethod
     def any(array: Array) -> Array:  # noqa: A003
         """Any."""
         ...
 
     @staticmethod
-    def asarray(array: Any, dtype: Any = ...) -> Array:
+    def asarray(array: Any, dtype: Any = ..., device: Any = ...) -> Array:
         """As array."""
         ...
 
@@ -139,6 +144,11 @@ class ArrayNamespace(Protocol[Array]):
         """Logical or."""
         ...
 
+    @staticmethod
+    def maximum(array1: Array, array2: Array, /) -> Array:
+        """Element-wise maximum."""
+        ...
+
     @staticmethod
     def mean(array: Array, /, axis: int | None = None) -> Array:
         """Mean."""
@@ -168,7 +178,7 @@ class ArrayNamespace(Protocol[Array]):
         ...
 
     @staticmethod
-    def where(condition: Array, x: Array, y: Array) -> Array:
+    def where(condition: Array, x: Array | float, y: Array | float) -> Array:
         """Where."""
         ...
 
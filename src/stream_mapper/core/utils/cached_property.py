@@ -5,7 +5,7 @@ from __future__ import annotations
 __all__: tuple[str, ...] = ()
 
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any, Generic, TypeVar, cast, overload
+from typing import TYPE_CHECKING, Any, Generic, TypeVar, overload
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -91,7 +91,8 @@ class cached_property(cached_[R]):  # noqa: N801
                 f"property '{self._name}' has no getter"
                 raise AttributeError
             object.__setattr__(obj, self._name_private, self.fget(obj))
-        return cast("R", getattr(obj, self._name_private))
+        value: R = getattr(obj, self._name_private)
+        return value
 
 
 @dataclass(frozen=True, slots=True)
@@ -123,4 +124,5 @@ class cached_noargmethod(cached_[R]):  # noqa: N801
 
             object.__setattr__(obj, self._name_private, WrappedValue(self.fget(obj)))
 
-        return cast("Callable[[], R]", getattr(obj, self._name_private))
+        method: Callable[[], R] = getattr(obj, self._name_private)
+        return method
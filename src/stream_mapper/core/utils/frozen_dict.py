@@ -342,7 +342,11 @@ class FrozenDictField(Generic[K, V]):
 
     def __set__(self, obj: object, value: Mapping[K, V]) -> None:
         # Set the value. This is only called once by the dataclass.
-        v = FrozenDict(value)
+        # A FrozenDict is immutable, so it doesn't need to be copied, nor does
+        # it need to be merged into an empty default.
+        v = value if type(value) is FrozenDict else FrozenDict(value)
         object.__setattr__(
-            obj, self._name, self._default | v if self._default is not MISSING else v
+            obj,
+            self._name,
+            self._default | v if self._default is not MISSING and self._default else v,
         )
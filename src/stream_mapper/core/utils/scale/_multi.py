@@ -5,13 +5,14 @@ from __future__ import annotations
 __all__: tuple[str, ...] = ()
 
 from dataclasses import dataclass, replace
-import functools
-import operator
+from itertools import chain
 from typing import TYPE_CHECKING, Any, overload
 
 from stream_mapper.core._data import Data
 from stream_mapper.core.typing import Array
+from stream_mapper.core.utils.compat import get_namespace
 from stream_mapper.core.utils.scale._api import DataScaler
+from stream_mapper.core.utils.scale._standard import StandardScaler
 
 if TYPE_CHECKING:
     from stream_mapper.core.typing import ArrayNamespace
@@ -36,9 +37,71 @@ class CompoundDataScaler(DataScaler[Array]):
         object.__setattr__(
             self,
             "names",
-            functools.reduce(operator.add, (s.names for s in self.scalers)),
+            tuple(chain.from_iterable(s.names for s in self.scalers)),
         )
 
+        # Cache of the per-scaler column names and indices, keyed by the
+        # requested names and the names of the data. See ``_plan``.
+        self._plans: dict[
+            tuple[tuple[str, ...], tuple[str, ...]],
+            tuple[tuple[DataScaler[Array], tuple[str, ...], list[int]], ...],
+        ]
+        object.__setattr__(self, "_plans", {})
+
+        # If all the scalers are standard scalers, then they can be fused into
+        # a single mean and scale, in the order of `names`. These are built
+        # here, once, so no arrays are created (and cached) when tracing, e.g.
+        # by a JIT. See ``_fused``.
+        self._fused_mean_scale: tuple[Array, Array] | None
+        fused = None
+        if self.scalers and all(type(s) is StandardScaler for s in self.scalers):
+            scalers: tuple[StandardScaler[Array], ...] = self.scalers  # type: ignore[assignment]
+            xp = get_namespace(scalers[0].mean)
+            fused = (
+                xp.concatenate(tuple(s.mean for s in scalers)),
+                xp.concatenate(tuple(s.scale for s in scalers)),
+            )
+        object.__setattr__(self, "_fused_mean_scale", fused)
+
+    def _fused(
+        self, names: tuple[str, ...], array: Array, data_names: tuple[str, ...], /
+    ) -> tuple[Array, Array] | None:
+        """Return the fused mean and scale, broadcastable against ``array``.
+
+        This is only possible if all the scalers are standard scalers and the
+        data and requested names are exactly `names`, in which case the
+        transform is one vectorized operation rather than one per scaler.
+        Otherwise `None` is returned.
+        """
+        if self._fused_mean_scale is None or not names == self.names == data_names:
+            return None
+        mean, scale = self._fused_mean_scale
+        sel = (None, slice(None)) + (None,) * (array.ndim - 2)
+        return mean[sel], scale[sel]
+
+    def _plan(
+        self, names: tuple[str, ...], data_names: tuple[str, ...], /
+    ) -> tuple[tuple[DataScaler[Array], tuple[str, ...], list[int]], ...]:
+        """Pair each scaler with the subset of ``names`` it is responsible for.
+
+        Each scaler is also paired with the column indices of those names in
+        the data, so the columns can be selected without a name lookup. The
+        result only depends on ``names`` and ``data_names``, so it is computed
+        once per distinct pair and reused on subsequent calls.
+        """
+        key = (names, data_names)
+        plan = self._plans.get(key)
+        if plan is None:
+            names_set = frozenset(names)
+            n2k = {n: i for i, n in enumerate(data_names)}
+            steps = []
+            for scaler in self.scalers:
+                ns = tuple(n for n in scaler.names if n in names_set)
+                steps.append((scaler, ns, [n2k[n] for n in ns]))
+            plan = tuple(steps)
+            self._plans[key] = plan
+        return plan
+
     # ---------------------------------------------------------------
 
     @overload
@@ -81,11 +144,16 @@ class CompoundDataScaler(DataScaler[Array]):
             Data(xp.asarray(data), names=names) if not isinstance(data, Data) else data
         )
 
+        array = data_.array
+        if (fused := self._fused(names, array, data_.names)) is not None:
+            mean, scale = fused
+            out = (array - mean) / scale
+            return Data(out, names=names) if is_data else out
+
         xds: list[Array] = []
         v: Data[Array] | Array
-        for scaler in self.scalers:
-            ns = tuple(n for n in scaler.names if n in names)
-            v = scaler.transform(data_[ns], names=ns, xp=xp)
+        for scaler, ns, idx in self._plan(names, data_.names):
+            v = scaler.transform(Data(array[:, idx], names=ns), names=ns, xp=xp)
             xds.append(v.array if isinstance(v, Data) else v)
         xd = xp.hstack(xds)
 
@@ -133,11 +201,16 @@ class CompoundDataScaler(DataScaler[Array]):
             Data(xp.asarray(data), names=names) if not isinstance(data, Data) else data
         )
 
+        array = data_.array
+        if (fused := self._fused(names, array, data_.names)) is not None:
+            mean, scale = fused
+            out = array * scale + mean
+            return Data(out, names=names) if is_data else out
+
         xds: list[Array] = []
         v: Data[Array] | Array
-        for scaler in self.scalers:
-            ns = tuple(n for n in scaler.names if n in names)
-            v = scaler.inverse_transform(data_[ns], names=ns, xp=xp)
+        for scaler, ns, idx in self._plan(names, data_.names):
+            v = scaler.inverse_transform(Data(array[:, idx], names=ns), names=ns, xp=xp)
             xds.append(v.array if isinstance(v, Data) else v)
         xd = xp.hstack(xds)
 
@@ -6,7 +6,7 @@ __all__: tuple[str, ...] = ()
 
 from dataclasses import dataclass, replace
 from functools import singledispatch
-from typing import Any, cast, overload
+from typing import Any, overload
 
 import numpy as np
 
@@ -90,9 +90,8 @@ class StandardScaler(DataScaler[Array]):
         """Standardize a dataset along the features axis."""
         mean = self.mean[[self.names.index(n) for n in names]]
         scale = self.scale[[self.names.index(n) for n in names]]
-        return cast(
-            Data[Array] | Array, _transform(data, mean, scale, names=names, xp=xp)
-        )
+        out: Data[Array] | Array = _transform(data, mean, scale, names=names, xp=xp)
+        return out
 
     # ---------------------------------------------------------------
 
@@ -127,10 +126,10 @@ class StandardScaler(DataScaler[Array]):
         xp: ArrayNamespace[Array] | None,
     ) -> Data[Array] | Array:
         """Scale back the data to the original representation."""
-        return cast(
-            Data[Array] | Array,
-            _transform_inv(data, self.mean, self.scale, names=names, xp=xp),
+        out: Data[Array] | Array = _transform_inv(
+            data, self.mean, self.scale, names=names, xp=xp
         )
+        return out
 
     # ---------------------------------------------------------------
 
@@ -0,0 +1,16 @@
+"""Test configuration."""
+
+import numpy as np
+
+from stream_mapper.core._connect.nn_namespace import NN_NAMESPACE
+from stream_mapper.core._connect.xp_namespace import (
+    XP_NAMESPACE,
+    XP_NAMESPACE_REVERSE,
+)
+
+# Register NumPy as an array namespace, so models can be built without an
+# array library extension package. NumPy has no NN namespace.
+XP_NAMESPACE.setdefault(np, np)  # type: ignore[attr-defined]
+XP_NAMESPACE.setdefault("numpy", np)  # type: ignore[attr-defined]
+XP_NAMESPACE_REVERSE.setdefault(np, "numpy")  # type: ignore[attr-defined]
+NN_NAMESPACE.setdefault(np, None)  # type: ignore[attr-defined]
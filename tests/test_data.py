@@ -0,0 +1,130 @@
+"""Tests for :class:`stream_mapper.core.Data`."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from stream_mapper.core import Data
+
+
+@pytest.fixture()
+def data() -> Data[np.ndarray]:
+    """Return a 3x4 data with named columns."""
+    return Data(np.arange(12.0).reshape(3, 4), names=("a", "b", "c", "d"))
+
+
+@pytest.mark.parametrize(
+    "name",
+    [
+        "__array_namespace__",
+        "__dlpack__",
+        "__dlpack_device__",
+        "__array_interface__",
+        "__array_priority__",
+    ],
+)
+def test_array_protocols(data: Data[np.ndarray], name: str) -> None:
+    """Test that the array protocols of the underlying array are forwarded."""
+    assert hasattr(data, name)
+    assert getattr(data, name) == getattr(data.array, name)
+
+
+def test_array_protocols_use(data: Data[np.ndarray]) -> None:
+    """Test that the data can be consumed through the array protocols."""
+    assert data.__array_namespace__() is np
+    np.testing.assert_array_equal(np.from_dlpack(data), data.array)
+    np.testing.assert_array_equal(np.asarray(data), data.array)
+
+
+def test_private_not_forwarded(data: Data[np.ndarray]) -> None:
+    """Test that private attributes are not forwarded."""
+    assert not hasattr(data, "_private")
+
+
+# =============================================================================
+# __getitem__
+
+
+def _n2k_built(data: Data[np.ndarray]) -> bool:
+    """Whether the name-to-index mapping has been built, without building it."""
+    try:
+        object.__getattribute__(data, "_n2k")
+    except AttributeError:
+        return False
+    return True
+
+
+@pytest.mark.parametrize("key", [1, np.int64(1), np.array(1)])
+def test_getitem_int(data: Data[np.ndarray], key: int) -> None:
+    """Test that an integer key gets a row, keeping the 2D shape."""
+    row = data[key]
+    assert isinstance(row, Data)
+    assert row.names == data.names
+    np.testing.assert_array_equal(row.array, data.array[1:2])
+
+
+def test_getitem_bool(data: Data[np.ndarray]) -> None:
+    """Test that a bool key does not take the integer-row path."""
+    with pytest.raises(ValueError, match="Number of names"):
+        data[True]
+
+
+@pytest.mark.parametrize(
+    "key",
+    [slice(0, 2), [0, 2], np.array([True, False, True]), np.array([2, 0])],
+)
+def test_getitem_rows(data: Data[np.ndarray], key: object) -> None:
+    """Test that slices, lists, masks and integer arrays get rows."""
+    rows = data[key]
+    assert isinstance(rows, Data)
+    assert rows.names == data.names
+    np.testing.assert_array_equal(rows.array, data.array[key])
+
+
+def test_getitem_str(data: Data[np.ndarray]) -> None:
+    """Test that a str key gets a column."""
+    np.testing.assert_array_equal(data["b"], data.array[:, 1])
+
+
+@pytest.mark.parametrize("key", [("b", "d"), ("c",)])
+def test_getitem_tuple_of_str(data: Data[np.ndarray], key: tuple[str, ...]) -> None:
+    """Test that a tuple of str keys gets the columns, in order."""
+    cols = data[key]
+    assert isinstance(cols, Data)
+    assert cols.names == key
+    idx = [data.names.index(k) for k in key]
+    np.testing.assert_array_equal(cols.array, data.array[:, idx])
+
+
+@pytest.mark.parametrize("columns", [[0, 2], ["a", "c"], ["a", 2]])
+def test_getitem_slice_list(data: Data[np.ndarray], columns: list[int | str]) -> None:
+    """Test that a (slice, list) key gets the named or indexed columns."""
+    cols = data[:, columns]
+    assert isinstance(cols, Data)
+    assert cols.names == ("a", "c")
+    np.testing.assert_array_equal(cols.array, data.array[:, [0, 2]])
+
+
+def test_getitem_slice_int(data: Data[np.ndarray]) -> None:
+    """Test that a (slice, int) key gets a column as an array."""
+    col = data[:, 1]
+    assert not isinstance(col, Data)
+    np.testing.assert_array_equal(col, data.array[:, 1])
+
+
+def test_getitem_rows_share_n2k(data: Data[np.ndarray]) -> None:
+    """Test that row selections share the name-to-index mapping, lazily."""
+    # Not built yet, so not built by selecting rows.
+    rows = data[0:2]
+    assert not _n2k_built(data)
+    assert not _n2k_built(rows)
+
+    # Built on first use, then shared by later row selections.
+    n2k = data._n2k
+    assert n2k == {"a": 0, "b": 1, "c": 2, "d": 3}
+    for key in (1, slice(0, 2)):
+        assert data[key]._n2k is n2k
+
+    # The selections still look up columns correctly.
+    np.testing.assert_array_equal(data[0:2]["c"], data.array[0:2, 2])
@@ -0,0 +1,43 @@
+"""Tests for :class:`stream_mapper.core.params.Params`."""
+
+from __future__ import annotations
+
+import pytest
+
+from stream_mapper.core.params import Params
+
+A, BX, BY = 1.0, 2.0, 3.0
+
+
+@pytest.fixture()
+def params() -> Params[float]:
+    """Return a Params with both flat and nested parameters."""
+    return Params({"a": A, "b": {"x": BX, "y": BY}})
+
+
+def test_getitem_tuple_keys(params: Params[float]) -> None:
+    """Test that tuple keys match the structured lookup."""
+    assert params[("a",)] == A
+    assert params[("b", "x")] == BX
+    assert params[("b", "y")] == BY
+    assert params[("b",)] == params["b"]
+    assert dict(params[("b",)]) == {"x": BX, "y": BY}
+
+    # Repeated lookups use the cached mapping and give the same results.
+    assert params[("b", "x")] == BX
+
+
+@pytest.mark.parametrize(
+    ("key", "msg"),
+    [
+        (("zz",), "zz"),
+        (("b", "z"), "z"),
+        (("a", "x"), "('a', 'x')"),
+        (("a", "b", "c"), "('a', 'b', 'c')"),
+    ],
+)
+def test_getitem_tuple_missing(params: Params[float], key: tuple, msg: str) -> None:
+    """Test that missing tuple keys fall back to the structured ``KeyError``."""
+    with pytest.raises(KeyError) as excinfo:
+        params[key]
+    assert excinfo.value.args == (msg,)
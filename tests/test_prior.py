@@ -0,0 +1,57 @@
+"""Tests for :class:`stream_mapper.core.prior.FunctionPrior`."""
+
+from __future__ import annotations
+
+from dataclasses import replace
+from typing import Any
+
+import numpy as np
+
+from stream_mapper.core.prior import FunctionPrior
+
+LOGPDF = 0.0
+
+
+def _logpdf_hook(mpars: Any, data: Any, model: Any, current_lnpdf: Any) -> Any:
+    return LOGPDF
+
+
+def _forward_hook(pred: Any, data: Any, model: Any) -> Any:
+    return pred
+
+
+def test_hook_compiler_applied_once() -> None:
+    """Test that the compiler is applied once to each hook, not on replace."""
+    compiled: list[Any] = []
+
+    def compiler(func: Any) -> Any:
+        compiled.append(func)
+
+        def wrapped(*args: Any) -> Any:
+            return func(*args)
+
+        return wrapped
+
+    prior = FunctionPrior(
+        _logpdf_hook, _forward_hook, hook_compiler=compiler, array_namespace=np
+    )
+    assert compiled == [_logpdf_hook, _forward_hook]
+    assert prior.logpdf_hook is not _logpdf_hook
+    assert prior.forward_hook is not _forward_hook
+
+    pred = np.arange(3.0)
+    assert prior.logpdf(None, None, None) == LOGPDF  # type: ignore[arg-type]
+    assert prior(pred, None, None) is pred  # type: ignore[arg-type]
+
+    # `replace` passes the already-compiled hooks, which are not re-compiled.
+    new = replace(prior, name="new")
+    assert compiled == [_logpdf_hook, _forward_hook]
+    assert new.logpdf_hook is prior.logpdf_hook
+    assert new.forward_hook is prior.forward_hook
+
+
+def test_hook_compiler_default() -> None:
+    """Test that the hooks are used as given without a compiler."""
+    prior = FunctionPrior(_logpdf_hook, _forward_hook, array_namespace=np)
+    assert prior.logpdf_hook is _logpdf_hook
+    assert prior.forward_hook is _forward_hook
@@ -0,0 +1,86 @@
+"""Tests for :class:`stream_mapper.core.utils.scale.CompoundDataScaler`."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from stream_mapper.core import Data
+from stream_mapper.core.utils.scale import CompoundDataScaler, StandardScaler
+
+
+@pytest.fixture()
+def scaler() -> CompoundDataScaler[np.ndarray]:
+    """Return a compound scaler of two standard scalers."""
+    return CompoundDataScaler(
+        (
+            StandardScaler(
+                mean=np.array([1.0, 2.0]), scale=np.array([2.0, 4.0]), names=("a", "b")
+            ),
+            StandardScaler(mean=np.array([-3.0]), scale=np.array([0.5]), names=("c",)),
+        )
+    )
+
+
+@pytest.fixture()
+def data() -> Data[np.ndarray]:
+    """Return data with the columns of the compound scaler."""
+    array = np.random.default_rng(0).normal(size=(10, 3))
+    return Data(array, names=("a", "b", "c"))
+
+
+def _unfused(
+    scaler: CompoundDataScaler[np.ndarray], data: Data[np.ndarray], method: str
+) -> np.ndarray:
+    """Apply each scaler to its own columns and stack the results."""
+    return np.hstack(
+        [
+            getattr(s, method)(data[s.names], names=s.names, xp=np).array
+            for s in scaler.scalers
+        ]
+    )
+
+
+@pytest.mark.parametrize("method", ["transform", "inverse_transform"])
+def test_fused_matches_unfused(
+    scaler: CompoundDataScaler[np.ndarray], data: Data[np.ndarray], method: str
+) -> None:
+    """Test that the fused transform matches the per-scaler transforms."""
+    expected = _unfused(scaler, data, method)
+
+    out = getattr(scaler, method)(data, names=scaler.names, xp=np)
+    assert not scaler._plans  # took the fused path
+    assert isinstance(out, Data)
+    assert out.names == scaler.names
+    np.testing.assert_allclose(out.array, expected)
+
+    # Arrays take the same path and give the same result.
+    out = getattr(scaler, method)(data.array, names=scaler.names, xp=np)
+    np.testing.assert_allclose(out, expected)
+
+    # Trailing axes are broadcast over.
+    out = getattr(scaler, method)(data.array[..., None], names=scaler.names, xp=np)
+    np.testing.assert_allclose(out[..., 0], expected)
+    assert not scaler._plans
+
+
+@pytest.mark.parametrize("method", ["transform", "inverse_transform"])
+def test_partial_names_not_fused(
+    scaler: CompoundDataScaler[np.ndarray], data: Data[np.ndarray], method: str
+) -> None:
+    """Test that a subset of the names takes the per-scaler path."""
+    names = ("a", "c")
+    array = data[names].array
+    assert scaler._fused(names, array, names) is None
+
+    out = getattr(scaler, method)(array, names=names, xp=np)
+    assert scaler._plans  # took the per-scaler path
+
+    a, c = scaler.scalers[0]["a"], scaler.scalers[1]
+    expected = np.hstack(
+        [
+            getattr(a, method)(data[("a",)], names=("a",), xp=np).array,
+            getattr(c, method)(data[("c",)], names=("c",), xp=np).array,
+        ]
+    )
+    np.testing.assert_allclose(out, expected)
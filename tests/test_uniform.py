@@ -0,0 +1,75 @@
+"""Tests for the Uniform model."""
+
+import numpy as np
+
+from stream_mapper.core import Data, Params
+from stream_mapper.core.builtin import Uniform
+from stream_mapper.core.params import ModelParameters
+
+
+def _make_uniform(coord_names):
+    return Uniform(
+        array_namespace="numpy",
+        coord_names=coord_names,
+        coord_bounds={"phi1": (0.0, 10.0), "phi2": (0.0, 5.0)},
+        data_scaler=None,
+        params=ModelParameters(),
+        require_where=False,
+    )
+
+
+def test_coord_bounds_order():
+    """Test that the bounds follow `coord_names`, not `coord_bounds`, order."""
+    # phi1 in [0, 10], phi2 in [0, 5]: the middle row is only inside the
+    # bounds if they are matched to the right columns.
+    data = Data(np.array([[7.0, 2.0], [4.0, 3.0], [2.0, 7.0]]), names=("phi1", "phi2"))
+    model = _make_uniform(("phi2", "phi1"))
+
+    lnp = model._ln_prior_coord_bnds(data)
+    np.testing.assert_array_equal(lnp, [0.0, 0.0, -np.inf])
+
+    lnlik = model.ln_likelihood(Params(), data)
+    np.testing.assert_allclose(lnlik[:2], -np.log(5.0) - np.log(10.0))
+    assert lnlik[2] == -np.inf
+
+    # Same as when the orders match.
+    other = _make_uniform(("phi1", "phi2"))
+    np.testing.assert_array_equal(other._ln_prior_coord_bnds(data), lnp)
+    np.testing.assert_array_equal(other.ln_likelihood(Params(), data), lnlik)
+
+
+def test_ln_likelihood_keeps_dtype():
+    """Test that the log-likelihood has the dtype of the data."""
+    data = Data(
+        np.array([[7.0, 2.0], [4.0, 3.0], [12.0, 1.0]], dtype=np.float32),
+        names=("phi1", "phi2"),
+    )
+    model = _make_uniform(("phi1", "phi2"))
+
+    lnlik = model.ln_likelihood(Params(), data)
+    assert lnlik.dtype == np.float32
+    np.testing.assert_allclose(lnlik[:2], -np.log(50.0), rtol=1e-6)
+    assert lnlik[2] == -np.inf
+
+
+def test_coord_bounds_subset():
+    """Test the coordinate bounds when only some coordinates are in the data."""
+    model = _make_uniform(("phi1", "phi2"))
+    data = Data(np.array([[1.0], [7.0], [-1.0]]), names=("phi2",))
+
+    lnp = model._ln_prior_coord_bnds(data)
+    np.testing.assert_array_equal(lnp, [0.0, -np.inf, -np.inf])
+
+    # Only Python floats are cached, no arrays created when called.
+    ((names, lo, hi),) = model._coord_bnds_plans.values()
+    assert (names, lo, hi) == (("phi2",), (0.0,), (5.0,))
+
+
+def test_hash_identity():
+    """Test that models are compared and hashed by identity."""
+    model = _make_uniform(("phi1", "phi2"))
+    other = _make_uniform(("phi1", "phi2"))
+
+    assert model in {model}
+    assert other not in {model}
+    assert model != other